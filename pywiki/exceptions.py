@@ -25,10 +25,11 @@ class InvalidValidatorError( ValueError ):
     def __init__( self, err_code, msg ):
         self.code = err_code
         self.msg = msg
+        self._str = f"[Errno {err_code}] {self.errors[err_code]}: {msg}"
         super().__init__( msg )
 
     def __str__( self ):
-        return f"[Errno {self.code}] {self.errors[self.code]}: {self.msg}"
+        return self._str
 
 
 class TxConfirmationTimedoutError( AssertionError ):
@@ -5,7 +5,7 @@ For more granular conversions, see Web3.toWei
 
 from decimal import Decimal
 
-_conversion_unit = Decimal( 1e18 )
+_CONVERSION_UNIT = Decimal( 1e18 )
 
 
 def convert_atto_to_woc( atto ) -> Decimal:
@@ -24,7 +24,7 @@ def convert_atto_to_woc( atto ) -> Decimal:
     """
     if isinstance( atto, float ):
         atto = int( atto )
-    return Decimal( atto ) / _conversion_unit
+    return Decimal( atto ) / _CONVERSION_UNIT
 
 
 def convert_woc_to_atto( woc ) -> Decimal:
@@ -42,4 +42,4 @@ def convert_woc_to_atto( woc ) -> Decimal:
     """
     if isinstance( woc, float ):
         woc = str( woc )
-    return Decimal( woc ) * _conversion_unit
+    return Decimal( woc ) * _CONVERSION_UNIT
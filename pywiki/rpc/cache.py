@@ -0,0 +1,72 @@
+"""
+In-process LRU + TTL cache for RPC responses
+"""
+
+import os
+import threading
+import time
+
+from collections import OrderedDict
+
+CACHE_ENV_VAR = "PYWIKI_RPC_CACHE"
+
+
+def cache_enabled() -> bool:
+    """Whether RPC response caching is turned on, which is opt-in through the
+    PYWIKI_RPC_CACHE=1 environment variable."""
+    return os.environ.get( CACHE_ENV_VAR, "" ) == "1"
+
+
+class TTLCache:
+    """Thread safe least recently used cache whose entries also expire after
+    a time to live."""
+    def __init__( self, maxsize = 4096, ttl = 60 ):
+        """
+        :param maxsize: Maximum number of entries, the least recently used is evicted beyond that
+        :param ttl: Default time to live of an entry, in seconds
+        """
+        if maxsize < 1:
+            raise ValueError( f"invalid cache size {maxsize}" )
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__( self ):
+        return f"<TTLCache {len( self )}/{self.maxsize} entries, ttl {self.ttl}s>"
+
+    def __len__( self ):
+        return len( self._entries )
+
+    def get( self, key, default = None ):
+        """Return the value cached for key, or default if it is missing or
+        has expired."""
+        with self._lock:
+            try:
+                expiry, value = self._entries.pop( key )
+            except KeyError:
+                return default
+            if expiry <= time.monotonic():
+                return default
+            # re-insert as the most recently used entry
+            self._entries[ key ] = ( expiry, value )
+            return value
+
+    def set( self, key, value, ttl = None ):
+        """Cache value for key, for ttl seconds (the cache default if
+        None)."""
+        if ttl is None:
+            ttl = self.ttl
+        with self._lock:
+            self._entries.pop( key, None )
+            self._entries[ key ] = ( time.monotonic() + ttl, value )
+            while len( self._entries ) > self.maxsize:
+                self._entries.popitem( last = False )
+
+    def clear( self ):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = TTLCache()
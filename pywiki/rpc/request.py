@@ -1,14 +1,182 @@
 """
-RPC wrapper around requests library
+RPC wrapper around requests library (or httpx, for HTTP/2)
 """
+import copy
+import functools
+import inspect
 import json
+import os
+import threading
+
+from itertools import chain, islice
 
 import requests
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache import cache_enabled, response_cache
+
 from .exceptions import RequestsError, RequestsTimeoutError, RPCError
 
 from ..constants import DEFAULT_ENDPOINT, DEFAULT_TIMEOUT
 
+from ..exceptions import InvalidRPCReplyError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+HTTP2_ENV_VAR = "PYWIKI_RPC_HTTP2"
+
+def _dumps( payload ):
+    """Serialize a JSON-RPC payload, with orjson (pywiki[fast]) if
+    available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps( payload )
+        except TypeError:
+            pass
+    return json.dumps( payload )
+
+
+def _has_float( obj ) -> bool:
+    """Whether a decoded JSON value contains a float, walking it one nesting
+    level at a time so that the per value work happens in C."""
+    level = [ obj ]
+    while True:
+        types = set( map( type, level ) )
+        if float in types:
+            return True
+        if dict not in types and list not in types:
+            return False
+        level = list(
+            chain(
+                chain.from_iterable(
+                    map(
+                        dict.values,
+                        [ value for value in level if type( value ) is dict ]
+                    )
+                ),
+                chain.from_iterable(
+                    [ value for value in level if type( value ) is list ]
+                ),
+            )
+        )
+
+
+def _loads( raw_resp ):
+    """Deserialize a JSON-RPC reply, with orjson (pywiki[fast]) if available
+    and safe for that reply.
+
+    Raises json.decoder.JSONDecodeError if raw_resp is not valid JSON.
+    """
+    if orjson is not None:
+        resp = orjson.loads( raw_resp )
+        # orjson only handles 64 bit integers, and silently decodes larger
+        # ones (such as balances in ATTO) as floats; RPC replies otherwise
+        # carry no floats, so a reply with any is decoded again with json
+        if not _has_float( resp ):
+            return resp
+    return json.loads( raw_resp )
+
+
+def _make_session() -> requests.Session:
+    """Session shared by all RPC requests, so that TCP (and TLS) connections
+    to an endpoint are kept alive and reused instead of being opened for
+    every call."""
+    session = requests.Session()
+    # only connection errors are retried: a POST that reached the node is
+    # never resent, whatever the reply (the node may already have acted on
+    # it, for instance accepted a sendRawTransaction), so read timeouts
+    # still surface as RequestsTimeoutError after a single attempt
+    retries = Retry( total = 2, read = False, backoff_factor = 0.1 )
+    adapter = HTTPAdapter(
+        pool_connections = 16,
+        pool_maxsize = 64,
+        max_retries = retries
+    )
+    session.mount( "http://", adapter )
+    session.mount( "https://", adapter )
+    session.headers[ "Content-Type" ] = "application/json"
+    return session
+
+
+_SESSION = _make_session()
+
+# endpoints of the form unix:///path/to/socket are reached over that unix
+# socket, with requests sent to a placeholder http URL
+UNIX_SOCKET_SCHEME = "unix://"
+_UNIX_SOCKET_URL = "http://localhost/"
+
+_HTTPX_CLIENTS = {}
+_HTTPX_CLIENTS_LOCK = threading.Lock()
+
+
+def http2_enabled() -> bool:
+    """Whether RPC requests are sent over HTTP/2, which is opt-in through the
+    PYWIKI_RPC_HTTP2=1 environment variable and requires pywiki[http2]."""
+    return os.environ.get( HTTP2_ENV_VAR, "" ) == "1"
+
+
+def _unix_socket_path( endpoint ):
+    """Socket path of a unix:// endpoint, None for other endpoints."""
+    if endpoint.startswith( UNIX_SOCKET_SCHEME ):
+        return endpoint[ len( UNIX_SOCKET_SCHEME ) : ]
+    return None
+
+
+def _import_httpx( purpose, extra ):
+    """Import httpx, an optional dependency which is only needed (and only
+    imported, keeping it out of the pywiki import time) for some
+    transports."""
+    try:
+        import httpx  # pylint: disable=import-outside-toplevel
+    except ImportError as err:
+        raise ImportError(
+            f"{purpose} require httpx, install pywiki[{extra}]"
+        ) from err
+    return httpx
+
+
+def _httpx_purpose( socket_path ):
+    """What an httpx client is needed for, and the extra providing it, for
+    _import_httpx; unix sockets need plain httpx, HTTP/2 also needs h2."""
+    if socket_path is None:
+        return "HTTP/2 RPC requests", "http2"
+    return "unix socket RPC requests", "async"
+
+
+def _get_httpx_client( socket_path = None ):
+    """httpx client shared by all RPC requests to the unix socket at
+    socket_path, or over HTTP/2 if socket_path is None; created on first use.
+
+    Over HTTP/2, concurrent requests to an endpoint are multiplexed over a
+    single connection.
+    """
+    with _HTTPX_CLIENTS_LOCK:
+        client = _HTTPX_CLIENTS.get( socket_path )
+        if client is None:
+            httpx = _import_httpx( *_httpx_purpose( socket_path ) )
+            client = httpx.Client(
+                transport = httpx.HTTPTransport(
+                    http2 = socket_path is None,
+                    uds = socket_path,
+                    retries = 2,
+                    limits = httpx.Limits(
+                        max_keepalive_connections = 16,
+                        max_connections = 64
+                    ),
+                ),
+                headers = {
+                    "Content-Type": "application/json"
+                },
+                follow_redirects = True,
+            )
+            _HTTPX_CLIENTS[ socket_path ] = client
+        return client
+
 
 def base_request(
     method,
@@ -25,7 +193,8 @@ def base_request(
     params: :obj:`list`, optional
         Parameters for the RPC method
     endpoint: :obj:`str`, optional
-        Endpoint to send request to
+        Endpoint to send request to, either an http(s) URL or
+        unix:///path/to/socket (which requires httpx)
     timeout: :obj:`int`, optional
         Timeout in seconds
 
@@ -43,27 +212,40 @@ def base_request(
     RequestsError
         If other request error occured
     """
+    return _post( _make_payload( method, params ), endpoint, timeout )
+
+
+def _make_payload( method, params, call_id = "1" ) -> dict:
+    """JSON-RPC 2.0 request object for a call."""
     if params is None:
         params = []
     elif not isinstance( params, list ):
         raise TypeError( f"invalid type {params.__class__}" )
+    return {
+        "id": call_id,
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": params
+    }
 
-    try:
-        payload = {
-            "id": "1",
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params
-        }
-        headers = {
-            "Content-Type": "application/json"
-        }
 
-        resp = requests.request(
-            "POST",
+def _post( payload, endpoint, timeout ) -> str:
+    """POST a JSON-RPC payload (single call or batch) and return the raw
+    reply."""
+    socket_path = _unix_socket_path( endpoint )
+    if socket_path is not None:
+        return _post_httpx(
+            _get_httpx_client( socket_path ),
+            payload,
+            endpoint,
+            timeout
+        )
+    if http2_enabled():
+        return _post_httpx( _get_httpx_client(), payload, endpoint, timeout )
+    try:
+        resp = _SESSION.post(
             endpoint,
-            headers = headers,
-            data = json.dumps( payload ),
+            data = _dumps( payload ),
             timeout = timeout,
             allow_redirects = True,
         )
@@ -74,6 +256,24 @@ def base_request(
         raise RequestsError( endpoint ) from err
 
 
+def _post_httpx( client, payload, endpoint, timeout ) -> str:
+    """_post with an httpx client, see _get_httpx_client."""
+    socket_path = _unix_socket_path( endpoint )
+    httpx = _import_httpx( *_httpx_purpose( socket_path ) )
+    url = _UNIX_SOCKET_URL if socket_path else endpoint
+    try:
+        resp = client.post(
+            url,
+            content = _dumps( payload ),
+            timeout = timeout
+        )
+        return resp.content
+    except httpx.TimeoutException as err:
+        raise RequestsTimeoutError( endpoint ) from err
+    except httpx.HTTPError as err:
+        raise RequestsError( endpoint ) from err
+
+
 def rpc_request(
     method,
     params = None,
@@ -114,11 +314,219 @@ def rpc_request(
     base_request
     """
     raw_resp = base_request( method, params, endpoint, timeout )
+    return _parse_response( method, endpoint, raw_resp )
 
+
+def _parse_response( method, endpoint, raw_resp ) -> dict:
+    """Decode the raw reply to a single RPC call, raising RPCError if it is
+    invalid or an error."""
     try:
-        resp = json.loads( raw_resp )
+        resp = _loads( raw_resp )
         if "error" in resp:
             raise RPCError( method, endpoint, str( resp[ "error" ] ) )
         return resp
     except json.decoder.JSONDecodeError as err:
         raise RPCError( method, endpoint, raw_resp ) from err
+
+
+def rpc_batch_request(
+    calls,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    batch_size = None
+) -> list:
+    """JSON-RPC 2.0 batch request, sending several calls in a single POST.
+
+    Parameters
+    ---------
+    calls: :obj:`list`
+        List of (method, params) tuples, params being a list or None
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    batch_size: :obj:`int`, optional
+        Maximum number of calls per POST, for endpoints that limit the
+        batch size; all calls are sent in one POST if None
+
+    Returns
+    -------
+    list
+        One dictionary per call, in the same order as calls, each being
+        the RPC response for that call (see rpc_request). Errors are
+        reported per call: a failed call has an "error" key in its
+        response instead of "result", and does not affect the others
+
+    Raises
+    ------
+    TypeError
+        If params of any call is not a list or None
+    ValueError
+        If batch_size is not a positive integer
+    RPCError
+        If the endpoint did not reply with a valid batch response
+    RequestsTimeoutError
+        If request timed out
+    RequestsError
+        If other request error occured
+
+    See Also
+    --------
+    rpc_request
+    """
+    payload = [
+        _make_payload( method,
+                       params,
+                       call_id ) for call_id,
+        ( method,
+          params ) in enumerate( calls )
+    ]
+    if batch_size is None:
+        batch_size = max( len( payload ), 1 )
+    elif not isinstance( batch_size, int ) or batch_size < 1:
+        raise ValueError( f"invalid batch size {batch_size}" )
+
+    responses = []
+    payload_iter = iter( payload )
+    while True:
+        batch = list( islice( payload_iter, batch_size ) )
+        if not batch:
+            return responses
+        raw_resp = _post( batch, endpoint, timeout )
+        methods = ",".join( sorted( { call[ "method" ] for call in batch } ) )
+        try:
+            resp = _loads( raw_resp )
+        except json.decoder.JSONDecodeError as err:
+            raise RPCError( methods, endpoint, raw_resp ) from err
+        # a single object instead of an array means the whole batch failed
+        if not isinstance( resp, list ):
+            error = resp.get( "error", resp ) if isinstance(
+                resp,
+                dict
+            ) else resp
+            raise RPCError( methods, endpoint, str( error ) )
+        by_id = {
+            reply.get( "id" ): reply
+            for reply in resp if isinstance( reply, dict )
+        }
+        for call in batch:
+            try:
+                responses.append( by_id[ call[ "id" ] ] )
+            except KeyError as err:
+                raise RPCError(
+                    call[ "method" ],
+                    endpoint,
+                    "missing reply in batch response"
+                ) from err
+
+
+def rpc_result(
+    method,
+    params = None,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    cache_ttl = None
+):
+    """Result of an RPC request, optionally served from the response cache.
+
+    Parameters
+    ---------
+    method: str
+        RPC Method to call
+    params: :obj:`list`, optional
+        Parameters for the RPC method
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    cache_ttl: :obj:`function`, optional
+        Maps a (non None) result to its lifetime in seconds in the response
+        cache, None meaning the result is not cached; only used when caching
+        is enabled, see pywiki.rpc.cache
+
+    Returns
+    -------
+    The "result" field of the RPC response
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If the RPC response has no result
+
+    See Also
+    --------
+    rpc_request
+    """
+    caching = cache_ttl is not None and cache_enabled()
+    if caching:
+        key = ( endpoint, method, tuple( params or () ) )
+        cached = response_cache.get( key )
+        if cached is not None:
+            return copy.deepcopy( cached )
+    try:
+        result = rpc_request(
+            method,
+            params = params,
+            endpoint = endpoint,
+            timeout = timeout
+        )[ "result" ]
+    except KeyError as exception:
+        raise InvalidRPCReplyError( method, endpoint ) from exception
+    if caching and result is not None:
+        result_ttl = cache_ttl( result )
+        if result_ttl is not None:
+            response_cache.set( key, copy.deepcopy( result ), result_ttl )
+    return result
+
+
+def rpc_method( method, cache_ttl = None ):
+    """Decorator turning a function into a call of the RPC method.
+
+    The decorated function must take endpoint and timeout arguments, and
+    return the list of parameters for the RPC method. The wrapper keeps its
+    signature and docstring, and returns the RPC result instead.
+
+    Parameters
+    ---------
+    method: str
+        RPC Method to call
+    cache_ttl: :obj:`function`, optional
+        Response cache lifetime of a result, see rpc_result
+
+    Returns
+    -------
+    function
+        Decorator
+    """
+    def decorator( func ):
+        # argument positions are resolved once here, binding the signature
+        # on every call would dominate the cost of the wrapper
+        parameters = inspect.signature( func ).parameters
+        names = list( parameters )
+        endpoint_index = names.index( "endpoint" )
+        endpoint_default = parameters[ "endpoint" ].default
+        timeout_index = names.index( "timeout" )
+        timeout_default = parameters[ "timeout" ].default
+
+        @functools.wraps( func )
+        def wrapper( *args, **kwargs ):
+            params = func( *args, **kwargs )
+            if len( args ) > endpoint_index:
+                endpoint = args[ endpoint_index ]
+            else:
+                endpoint = kwargs.get( "endpoint", endpoint_default )
+            if len( args ) > timeout_index:
+                timeout = args[ timeout_index ]
+            else:
+                timeout = kwargs.get( "timeout", timeout_default )
+            return rpc_result(
+                method,
+                params = params,
+                endpoint = endpoint,
+                timeout = timeout,
+                cache_ttl = cache_ttl,
+            )
+
+        return wrapper
+
+    return decorator
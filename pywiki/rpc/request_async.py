@@ -0,0 +1,168 @@
+"""
+Asynchronous RPC wrapper around the httpx library (optional dependency,
+install with `pip install pywiki[async]`)
+"""
+from .exceptions import RequestsError, RequestsTimeoutError
+
+from .request import (
+    _UNIX_SOCKET_URL,
+    _dumps,
+    _import_httpx,
+    _make_payload,
+    _parse_response,
+    _unix_socket_path,
+    http2_enabled,
+)
+
+from ..constants import DEFAULT_ENDPOINT, DEFAULT_TIMEOUT
+
+
+def make_client( endpoint = None, **kwargs ):
+    """Create an httpx.AsyncClient to share between async RPC requests, so
+    that they reuse its connection pool.
+
+    Parameters
+    ----------
+    endpoint: :obj:`str`, optional
+        Endpoint the client is for; only needed for unix:///path/to/socket
+        endpoints, which get a client connected to that socket
+    kwargs
+        Passed on to httpx.AsyncClient; http2 defaults to True when
+        PYWIKI_RPC_HTTP2=1, see pywiki.rpc.request.http2_enabled
+
+    Returns
+    -------
+    httpx.AsyncClient
+        Client to use as an async context manager
+
+    Raises
+    ------
+    ImportError
+        If httpx is not installed
+    """
+    httpx = _import_httpx( "async RPC requests", "async" )
+    kwargs.setdefault( "headers", { "Content-Type": "application/json" } )
+    kwargs.setdefault( "http2", http2_enabled() )
+    socket_path = _unix_socket_path( endpoint ) if endpoint else None
+    if socket_path is not None:
+        kwargs.setdefault(
+            "transport",
+            httpx.AsyncHTTPTransport( uds = socket_path )
+        )
+    return httpx.AsyncClient( **kwargs )
+
+
+async def base_request_async(
+    method,
+    params = None,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    client = None
+) -> str:
+    """Basic asynchronous RPC request.
+
+    Parameters
+    ---------
+    method: str
+        RPC Method to call
+    params: :obj:`list`, optional
+        Parameters for the RPC method
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    client: :obj:`httpx.AsyncClient`, optional
+        Client to send the request with (see make_client); a temporary one is
+        created if None
+
+    Returns
+    -------
+    str
+        Raw output from the request
+
+    Raises
+    ------
+    TypeError
+        If params is not a list or None
+    ImportError
+        If httpx is not installed
+    RequestsTimeoutError
+        If request timed out
+    RequestsError
+        If other request error occured
+
+    See Also
+    --------
+    pywiki.rpc.request.base_request
+    """
+    payload = _make_payload( method, params )
+    if client is None:
+        async with make_client( endpoint ) as temp_client:
+            return await _post_async( temp_client, payload, endpoint, timeout )
+    return await _post_async( client, payload, endpoint, timeout )
+
+
+async def _post_async( client, payload, endpoint, timeout ) -> str:
+    """POST a JSON-RPC payload with client and return the raw reply."""
+    httpx = _import_httpx( "async RPC requests", "async" )
+    url = _UNIX_SOCKET_URL if _unix_socket_path( endpoint ) else endpoint
+    try:
+        resp = await client.post(
+            url,
+            content = _dumps( payload ),
+            timeout = timeout,
+            follow_redirects = True,
+        )
+        return resp.content
+    except httpx.TimeoutException as err:
+        raise RequestsTimeoutError( endpoint ) from err
+    except httpx.HTTPError as err:
+        raise RequestsError( endpoint ) from err
+
+
+async def rpc_request_async(
+    method,
+    params = None,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    client = None
+) -> dict:
+    """Asynchronous RPC request.
+
+    Parameters
+    ---------
+    method: str
+        RPC Method to call
+    params: :obj:`list`, optional
+        Parameters for the RPC method
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    client: :obj:`httpx.AsyncClient`, optional
+        Client to send the request with (see make_client); a temporary one is
+        created if None
+
+    Returns
+    -------
+    dict
+        Returns dictionary representation of RPC response, see
+        pywiki.rpc.request.rpc_request
+
+    Raises
+    ------
+    RPCError
+        If RPC response returned a blockchain error
+
+    See Also
+    --------
+    base_request_async
+    """
+    raw_resp = await base_request_async(
+        method,
+        params,
+        endpoint,
+        timeout,
+        client
+    )
+    return _parse_response( method, endpoint, raw_resp )
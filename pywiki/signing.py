@@ -19,6 +19,7 @@ from eth_rlp import HashableRLP
 from hexbytes import HexBytes
 
 from eth_account import Account
+from eth_account.signers.local import LocalAccount
 from eth_account.datastructures import SignedTransaction
 from eth_account._utils.legacy_transactions import (
     Transaction as SignedEthereumTxData,
@@ -138,7 +139,10 @@ def serialize_transaction( filled_transaction ):
 def sanitize_transaction( transaction_dict, private_key ):
     """remove the originating address from the dict and convert chainId to
     int."""
-    account = Account.from_key( private_key )  # pylint: disable=no-value-for-parameter
+    if isinstance( private_key, LocalAccount ):
+        account = private_key
+    else:
+        account = Account.from_key( private_key )  # pylint: disable=no-value-for-parameter
     sanitized_transaction = (
         transaction_dict.copy()
     )  # do not alter the original dictionary
@@ -182,7 +186,8 @@ def sign_transaction( transaction_dict, private_key ) -> SignedTransaction:
         r:  :obj:`int` First 32 bytes of the signature, optional
         s:  :obj:`int` Next  32 bytes of the signature, optional
         v:  :obj:`int` Recovery value, optional
-    private_key: :obj:`str` The private key
+    private_key: :obj:`str` The private key, or a
+        :obj:`eth_account.signers.local.LocalAccount` already derived from it
 
     Returns
     -------
@@ -5,13 +5,158 @@ Interact with Woop's transaction RPC API
 import time
 import random
 from .constants import DEFAULT_ENDPOINT, DEFAULT_TIMEOUT
-from .rpc.request import rpc_request
+from .rpc.request import rpc_batch_request, rpc_method
+from .rpc.request_async import make_client, rpc_request_async
+from .rpc.exceptions import RPCError
 from .exceptions import TxConfirmationTimedoutError, InvalidRPCReplyError
 
+# RPC method names
+_PENDING_TRANSACTIONS = "wikiv2_pendingTransactions"
+_GET_CURRENT_TRANSACTION_ERROR_SINK = "wikiv2_getCurrentTransactionErrorSink"
+_PENDING_STAKING_TRANSACTIONS = "wikiv2_pendingStakingTransactions"
+_GET_CURRENT_STAKING_ERROR_SINK = "wikiv2_getCurrentStakingErrorSink"
+_GET_POOL_STATS = "wikiv2_getPoolStats"
+_GET_TRANSACTION_BY_HASH = "wikiv2_getTransactionByHash"
+_GET_TRANSACTION_BY_BLOCK_HASH_AND_INDEX = (
+    "wikiv2_getTransactionByBlockHashAndIndex"
+)
+_GET_TRANSACTION_BY_BLOCK_NUMBER_AND_INDEX = (
+    "wikiv2_getTransactionByBlockNumberAndIndex"
+)
+_GET_TRANSACTION_RECEIPT = "wikiv2_getTransactionReceipt"
+_SEND_RAW_TRANSACTION = "wikiv2_sendRawTransaction"
+_GET_PENDING_CX_RECEIPTS = "wikiv2_getPendingCXReceipts"
+_GET_CX_RECEIPT_BY_HASH = "wikiv2_getCXReceiptByHash"
+_RESEND_CX = "wikiv2_resendCx"
+_GET_STAKING_TRANSACTION_BY_HASH = "wikiv2_getStakingTransactionByHash"
+_GET_STAKING_TRANSACTION_BY_BLOCK_HASH_AND_INDEX = (
+    "wikiv2_getStakingTransactionByBlockHashAndIndex"
+)
+_GET_STAKING_TRANSACTION_BY_BLOCK_NUMBER_AND_INDEX = (
+    "wikiv2_getStakingTransactionByBlockNumberAndIndex"
+)
+_SEND_RAW_STAKING_TRANSACTION = "wikiv2_sendRawStakingTransaction"
+
+# confirmation polling backoff, in seconds
+_POLL_INITIAL_DELAY = 0.2
+_POLL_MAX_DELAY = 2.0
+
+# response cache lifetimes, in seconds
+_FINALIZED_TTL = 600
+_POOL_TTL = 1
+
+
+def _batch_results( method, params_list, endpoint, timeout, batch_size ):
+    """Call method once per entry of params_list in a JSON-RPC batch and
+    return the list of results, in the same order as params_list."""
+    responses = rpc_batch_request(
+        [ ( method, params ) for params in params_list ],
+        endpoint = endpoint,
+        timeout = timeout,
+        batch_size = batch_size,
+    )
+    results = []
+    for resp in responses:
+        if "error" in resp:
+            raise RPCError( method, endpoint, str( resp[ "error" ] ) )
+        try:
+            results.append( resp[ "result" ] )
+        except KeyError as exception:
+            raise InvalidRPCReplyError( method, endpoint ) from exception
+    return results
+
+
+def _pool_ttl( _ ):
+    """Pool contents change every block."""
+    return _POOL_TTL
+
+
+def _finalized_ttl( tx_response ):
+    """Transactions never change once in a block; pending ones are not
+    cached."""
+    return _FINALIZED_TTL if _is_finalized( tx_response ) else None
+
+
+def _found_ttl( _ ):
+    """Receipts only exist for finalized transactions."""
+    return _FINALIZED_TTL
+
+
+def _backoff_delays():
+    """Exponentially increasing polling delays, with up to 25% jitter."""
+    delay = _POLL_INITIAL_DELAY
+    while True:
+        yield delay + random.uniform( 0, delay * 0.25 )
+        delay = min( delay * 2, _POLL_MAX_DELAY )
+
+
+def _poll_until( fetch, predicate, timeout ):
+    """Call fetch with exponential backoff until predicate holds for its
+    result and return that result, or raise TxConfirmationTimedoutError after
+    timeout seconds."""
+    start_time = time.time()
+    for delay in _backoff_delays():
+        response = fetch()
+        if predicate( response ):
+            return response
+        remaining = timeout - ( time.time() - start_time )
+        if remaining <= 0:
+            break
+        time.sleep( min( delay, remaining ) )
+    raise TxConfirmationTimedoutError(
+        "Could not confirm transaction on-chain."
+    )
+
+
+async def _poll_until_async( fetch, predicate, timeout ):
+    """Asynchronous version of _poll_until, fetch being a coroutine
+    function."""
+    # asyncio is imported on use, it is slow to import and most callers
+    # only need the synchronous API
+    import asyncio  # pylint: disable=import-outside-toplevel
+    start_time = time.time()
+    for delay in _backoff_delays():
+        response = await fetch()
+        if predicate( response ):
+            return response
+        remaining = timeout - ( time.time() - start_time )
+        if remaining <= 0:
+            break
+        await asyncio.sleep( min( delay, remaining ) )
+    raise TxConfirmationTimedoutError(
+        "Could not confirm transaction on-chain."
+    )
+
+
+async def _rpc_result_async( method, params, endpoint, timeout, client ):
+    """Return the result of an asynchronous RPC call."""
+    try:
+        return (
+            await rpc_request_async(
+                method,
+                params = params,
+                endpoint = endpoint,
+                timeout = timeout,
+                client = client
+            )
+        )[ "result" ]
+    except KeyError as exception:
+        raise InvalidRPCReplyError( method, endpoint ) from exception
+
+
+def _is_finalized( tx_response ) -> bool:
+    """Whether a transaction lookup result has a (non-zero) block hash."""
+    return tx_response is not None and int(
+        tx_response.get( "blockHash",
+                         "0x00" ),
+        16
+    ) != 0
+
 
 #########################
 # Transaction Pool RPCs #
 #########################
+@rpc_method( _PENDING_TRANSACTIONS, cache_ttl = _pool_ttl )
 def get_pending_transactions(
     endpoint = DEFAULT_ENDPOINT,
     timeout = DEFAULT_TIMEOUT
@@ -38,15 +183,55 @@ def get_pending_transactions(
     -------------
     https://api.woopchain.com/#de6c4a12-fa42-44e8-972f-801bfde1dd18
     """
-    method = "wikiv2_pendingTransactions"
-    try:
-        return rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return []
+
+
+def get_pending_transactions_detailed(
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    batch_size = None
+) -> list:
+    """Get the current state of each pending transaction, with one request
+    for the pool and a single batched request for the lookups by hash.
+
+    Parameters
+    ----------
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    batch_size: :obj:`int`, optional
+        Maximum number of lookups per batched request, all in one request
+        if None
 
+    Returns
+    -------
+    list of transactions in the pool, see get_transaction_by_hash for a
+    description; transactions finalized since the pool was fetched have
+    their block information filled in
 
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+    RPCError
+        If any of the lookups returned an error
+
+    See Also
+    --------
+    get_pending_transactions
+    get_transactions_by_hashes
+    """
+    pool = get_pending_transactions( endpoint = endpoint, timeout = timeout )
+    return get_transactions_by_hashes(
+        [ tx[ "hash" ] for tx in pool ],
+        endpoint = endpoint,
+        timeout = timeout,
+        batch_size = batch_size,
+    )
+
+
+@rpc_method( _GET_CURRENT_TRANSACTION_ERROR_SINK )
 def get_transaction_error_sink(
     endpoint = DEFAULT_ENDPOINT,
     timeout = DEFAULT_TIMEOUT
@@ -76,15 +261,10 @@ def get_transaction_error_sink(
     -------------
     https://api.woopchain.com/#9aedbc22-6262-44b1-8276-cd8ae19fa600
     """
-    method = "wikiv2_getCurrentTransactionErrorSink"
-    try:
-        return rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return []
 
 
+@rpc_method( _PENDING_STAKING_TRANSACTIONS, cache_ttl = _pool_ttl )
 def get_pending_staking_transactions(
     endpoint = DEFAULT_ENDPOINT,
     timeout = DEFAULT_TIMEOUT
@@ -111,15 +291,58 @@ def get_pending_staking_transactions(
     -------------
     https://api.woopchain.com/#de0235e4-f4c9-4a69-b6d2-b77dc1ba7b12
     """
-    method = "wikiv2_pendingStakingTransactions"
-    try:
-        return rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return []
 
 
+def get_pending_staking_transactions_detailed(
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    batch_size = None
+) -> list:
+    """Get the current state of each pending staking transaction, with one
+    request for the pool and a single batched request for the lookups by
+    hash.
+
+    Parameters
+    ----------
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    batch_size: :obj:`int`, optional
+        Maximum number of lookups per batched request, all in one request
+        if None
+
+    Returns
+    -------
+    list of staking transactions in the pool, see
+    get_staking_transaction_by_hash for a description
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+    RPCError
+        If any of the lookups returned an error
+
+    See Also
+    --------
+    get_pending_staking_transactions
+    get_staking_transactions_by_hashes
+    """
+    pool = get_pending_staking_transactions(
+        endpoint = endpoint,
+        timeout = timeout
+    )
+    return get_staking_transactions_by_hashes(
+        [ tx[ "hash" ] for tx in pool ],
+        endpoint = endpoint,
+        timeout = timeout,
+        batch_size = batch_size,
+    )
+
+
+@rpc_method( _GET_CURRENT_STAKING_ERROR_SINK )
 def get_staking_transaction_error_sink(
     endpoint = DEFAULT_ENDPOINT,
     timeout = DEFAULT_TIMEOUT
@@ -150,15 +373,10 @@ def get_staking_transaction_error_sink(
     -------------
     https://api.woopchain.com/#bdd00e0f-2ba0-480e-b996-2ef13f10d75a
     """
-    method = "wikiv2_getCurrentStakingErrorSink"
-    try:
-        return rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return []
 
 
+@rpc_method( _GET_POOL_STATS, cache_ttl = _pool_ttl )
 def get_pool_stats(
     endpoint = DEFAULT_ENDPOINT,
     timeout = DEFAULT_TIMEOUT
@@ -188,18 +406,13 @@ def get_pool_stats(
     -------------
     https://api.woopchain.com/#7c2b9395-8f5e-4eb5-a687-2f1be683d83e
     """
-    method = "wikiv2_getPoolStats"
-    try:
-        return rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return []
 
 
 ####################
 # Transaction RPCs #
 ####################
+@rpc_method( _GET_TRANSACTION_BY_HASH, cache_ttl = _finalized_ttl )
 def get_transaction_by_hash(
     tx_hash,
     endpoint = DEFAULT_ENDPOINT,
@@ -249,19 +462,57 @@ def get_transaction_by_hash(
     -------------
     https://api.woopchain.com/#117e84f6-a0ec-444e-abe0-455701310389
     """
-    method = "wikiv2_getTransactionByHash"
-    params = [ tx_hash ]
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return [ tx_hash ]
+
+
+def get_transactions_by_hashes(
+    tx_hashes,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    batch_size = None
+) -> list:
+    """Get several transactions by hash in a single batched request.
+
+    Parameters
+    ----------
+    tx_hashes: :obj:`list` of :obj:`str`
+        Transaction hashes to fetch
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    batch_size: :obj:`int`, optional
+        Maximum number of hashes per request, all in one request if None
 
+    Returns
+    -------
+    list of transactions in the same order as tx_hashes, see
+    get_transaction_by_hash for a description (None for a hash not found)
 
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+    RPCError
+        If the lookup of any of the hashes returned an error
+
+    API Reference
+    -------------
+    https://api.woopchain.com/#117e84f6-a0ec-444e-abe0-455701310389
+    """
+    return _batch_results(
+        _GET_TRANSACTION_BY_HASH,
+        [ [ tx_hash ] for tx_hash in tx_hashes ],
+        endpoint,
+        timeout,
+        batch_size,
+    )
+
+
+@rpc_method(
+    _GET_TRANSACTION_BY_BLOCK_HASH_AND_INDEX,
+    cache_ttl = _finalized_ttl
+)
 def get_transaction_by_block_hash_and_index(
     block_hash,
     tx_index,
@@ -295,19 +546,13 @@ def get_transaction_by_block_hash_and_index(
     -------------
     https://api.woopchain.com/#7c7e8d90-4984-4ebe-bb7e-d7adec167503
     """
-    method = "wikiv2_getTransactionByBlockHashAndIndex"
-    params = [ block_hash, tx_index ]
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return [ block_hash, tx_index ]
 
 
+@rpc_method(
+    _GET_TRANSACTION_BY_BLOCK_NUMBER_AND_INDEX,
+    cache_ttl = _finalized_ttl
+)
 def get_transaction_by_block_number_and_index(
     block_num,
     tx_index,
@@ -341,19 +586,10 @@ def get_transaction_by_block_number_and_index(
     -------------
     https://api.woopchain.com/#bcde8b1c-6ab9-4950-9835-3c7564e49c3e
     """
-    method = "wikiv2_getTransactionByBlockNumberAndIndex"
-    params = [ block_num, tx_index ]
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return [ block_num, tx_index ]
 
 
+@rpc_method( _GET_TRANSACTION_RECEIPT, cache_ttl = _found_ttl )
 def get_transaction_receipt(
     tx_hash,
     endpoint = DEFAULT_ENDPOINT,
@@ -399,19 +635,55 @@ def get_transaction_receipt(
     -------------
     https://api.woopchain.com/#0c2799f8-bcdc-41a4-b362-c3a6a763bb5e
     """
-    method = "wikiv2_getTransactionReceipt"
-    params = [ tx_hash ]
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return [ tx_hash ]
+
+
+def get_transaction_receipts(
+    tx_hashes,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    batch_size = None
+) -> list:
+    """Get the transaction receipts for several hashes in a single batched
+    request.
+
+    Parameters
+    ----------
+    tx_hashes: :obj:`list` of :obj:`str`
+        Transaction hashes of the receipts to fetch
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    batch_size: :obj:`int`, optional
+        Maximum number of hashes per request, all in one request if None
+
+    Returns
+    -------
+    list of receipts in the same order as tx_hashes, see
+    get_transaction_receipt for a description
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+    RPCError
+        If the lookup of any of the hashes returned an error
+
+    API Reference
+    -------------
+    https://api.woopchain.com/#0c2799f8-bcdc-41a4-b362-c3a6a763bb5e
+    """
+    return _batch_results(
+        _GET_TRANSACTION_RECEIPT,
+        [ [ tx_hash ] for tx_hash in tx_hashes ],
+        endpoint,
+        timeout,
+        batch_size,
+    )
 
 
+@rpc_method( _SEND_RAW_TRANSACTION )
 def send_raw_transaction(
     signed_tx,
     endpoint = DEFAULT_ENDPOINT,
@@ -444,17 +716,7 @@ def send_raw_transaction(
     -------------
     https://api.woopchain.com/#f40d124a-b897-4b7c-baf3-e0dedf8f40a0
     """
-    params = [ signed_tx ]
-    method = "wikiv2_sendRawTransaction"
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return [ signed_tx ]
 
 
 def send_and_confirm_raw_transaction(
@@ -492,23 +754,20 @@ def send_and_confirm_raw_transaction(
     https://api.woopchain.com/#f40d124a-b897-4b7c-baf3-e0dedf8f40a0
     """
     tx_hash = send_raw_transaction( signed_tx, endpoint = endpoint )
-    start_time = time.time()
-    while ( time.time() - start_time ) <= timeout:
-        tx_response = get_transaction_by_hash( tx_hash, endpoint = endpoint )
-        if tx_response is not None:
-            block_hash = tx_response.get( "blockHash", "0x00" )
-            unique_chars = "".join( set( list( block_hash[ 2 : ] ) ) )
-            if unique_chars != "0":
-                return tx_response
-        time.sleep( random.uniform( 0.2, 0.5 ) )
-    raise TxConfirmationTimedoutError(
-        "Could not confirm transaction on-chain."
+    # the receipt only exists once the transaction is in a block
+    _poll_until(
+        lambda: get_transaction_receipt( tx_hash,
+                                         endpoint = endpoint ),
+        lambda receipt: receipt is not None,
+        timeout,
     )
+    return get_transaction_by_hash( tx_hash, endpoint = endpoint )
 
 
 ###############################
 # CrossShard Transaction RPCs #
 ###############################
+@rpc_method( _GET_PENDING_CX_RECEIPTS, cache_ttl = _pool_ttl )
 def get_pending_cx_receipts(
     endpoint = DEFAULT_ENDPOINT,
     timeout = DEFAULT_TIMEOUT
@@ -558,15 +817,59 @@ def get_pending_cx_receipts(
     -------------
     https://api.woopchain.com/#fe60070d-97b4-458d-9365-490b44c18851
     """
-    method = "wikiv2_getPendingCXReceipts"
-    try:
-        return rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return []
+
+
+def get_pending_cx_receipts_detailed(
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    batch_size = None
+) -> list:
+    """Get the cross shard receipt of every transaction in the pending CX
+    receipts, with one request for the pending receipts and a single batched
+    request for the lookups by hash.
+
+    Parameters
+    ----------
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    batch_size: :obj:`int`, optional
+        Maximum number of lookups per batched request, all in one request
+        if None
+
+    Returns
+    -------
+    list of cross shard receipts, one per transaction in the receipts of
+    get_pending_cx_receipts, see get_cx_receipt_by_hash for a description
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+    RPCError
+        If any of the lookups returned an error
 
+    See Also
+    --------
+    get_pending_cx_receipts
+    get_cx_receipt_by_hash
+    """
+    pending = get_pending_cx_receipts( endpoint = endpoint, timeout = timeout )
+    return _batch_results(
+        _GET_CX_RECEIPT_BY_HASH,
+        [
+            [ receipt[ "txHash" ] ] for proof in pending
+            for receipt in proof[ "receipts" ]
+        ],
+        endpoint,
+        timeout,
+        batch_size,
+    )
 
+
+@rpc_method( _GET_CX_RECEIPT_BY_HASH, cache_ttl = _found_ttl )
 def get_cx_receipt_by_hash(
     cx_hash,
     endpoint = DEFAULT_ENDPOINT,
@@ -605,19 +908,10 @@ def get_cx_receipt_by_hash(
     -------------
     https://api.woopchain.com/#3d6ad045-800d-4021-aeb5-30a0fbf724fe
     """
-    params = [ cx_hash ]
-    method = "wikiv2_getCXReceiptByHash"
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return [ cx_hash ]
 
 
+@rpc_method( _RESEND_CX )
 def resend_cx_receipt(
     cx_hash,
     endpoint = DEFAULT_ENDPOINT,
@@ -649,22 +943,13 @@ def resend_cx_receipt(
     -------------
     https://api.woopchain.com/#c658b56b-d20b-480d-b71a-b0bc505d2164
     """
-    method = "wikiv2_resendCx"
-    params = [ cx_hash ]
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return [ cx_hash ]
 
 
 ############################
 # Staking Transaction RPCs #
 ############################
+@rpc_method( _GET_STAKING_TRANSACTION_BY_HASH, cache_ttl = _finalized_ttl )
 def get_staking_transaction_by_hash(
     tx_hash,
     endpoint = DEFAULT_ENDPOINT,
@@ -708,19 +993,57 @@ def get_staking_transaction_by_hash(
     -------------
     https://api.woopchain.com/#296cb4d0-bce2-48e3-bab9-64c3734edd27
     """
-    method = "wikiv2_getStakingTransactionByHash"
-    params = [ tx_hash ]
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return [ tx_hash ]
+
+
+def get_staking_transactions_by_hashes(
+    tx_hashes,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    batch_size = None
+) -> list:
+    """Get several staking transactions by hash in a single batched request.
+
+    Parameters
+    ----------
+    tx_hashes: :obj:`list` of :obj:`str`
+        Hashes of staking transactions to fetch
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    batch_size: :obj:`int`, optional
+        Maximum number of hashes per request, all in one request if None
+
+    Returns
+    -------
+    list of staking transactions in the same order as tx_hashes, see
+    get_staking_transaction_by_hash for a description
 
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+    RPCError
+        If the lookup of any of the hashes returned an error
 
+    API Reference
+    -------------
+    https://api.woopchain.com/#296cb4d0-bce2-48e3-bab9-64c3734edd27
+    """
+    return _batch_results(
+        _GET_STAKING_TRANSACTION_BY_HASH,
+        [ [ tx_hash ] for tx_hash in tx_hashes ],
+        endpoint,
+        timeout,
+        batch_size,
+    )
+
+
+@rpc_method(
+    _GET_STAKING_TRANSACTION_BY_BLOCK_HASH_AND_INDEX,
+    cache_ttl = _finalized_ttl
+)
 def get_staking_transaction_by_block_hash_and_index(
     block_hash,
     tx_index,
@@ -753,19 +1076,13 @@ def get_staking_transaction_by_block_hash_and_index(
     -------------
     https://api.woopchain.com/#ba96cf61-61fe-464a-aa06-2803bb4b358f
     """
-    method = "wikiv2_getStakingTransactionByBlockHashAndIndex"
-    params = [ block_hash, tx_index ]
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return [ block_hash, tx_index ]
 
 
+@rpc_method(
+    _GET_STAKING_TRANSACTION_BY_BLOCK_NUMBER_AND_INDEX,
+    cache_ttl = _finalized_ttl
+)
 def get_staking_transaction_by_block_number_and_index(
     block_num,
     tx_index,
@@ -798,19 +1115,10 @@ def get_staking_transaction_by_block_number_and_index(
     -------------
     https://api.woopchain.com/#fb41d717-1645-4d3e-8071-6ce8e1b65dd3
     """
-    method = "wikiv2_getStakingTransactionByBlockNumberAndIndex"
-    params = [ block_num, tx_index ]
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return [ block_num, tx_index ]
 
 
+@rpc_method( _SEND_RAW_STAKING_TRANSACTION )
 def send_raw_staking_transaction(
     raw_tx,
     endpoint = DEFAULT_ENDPOINT,
@@ -843,17 +1151,7 @@ def send_raw_staking_transaction(
     -------------
     https://api.woopchain.com/#e8c17fe9-e730-4c38-95b3-6f1a5b1b9401
     """
-    method = "wikiv2_sendRawStakingTransaction"
-    params = [ raw_tx ]
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return [ raw_tx ]
 
 
 def send_and_confirm_raw_staking_transaction(
@@ -891,18 +1189,408 @@ def send_and_confirm_raw_staking_transaction(
     https://api.woopchain.com/#e8c17fe9-e730-4c38-95b3-6f1a5b1b9401
     """
     tx_hash = send_raw_staking_transaction( signed_tx, endpoint = endpoint )
-    start_time = time.time()
-    while ( time.time() - start_time ) <= timeout:
-        tx_response = get_staking_transaction_by_hash(
+    return _poll_until(
+        lambda: get_staking_transaction_by_hash( tx_hash,
+                                                 endpoint = endpoint ),
+        _is_finalized,
+        timeout,
+    )
+
+
+#####################
+# Asynchronous RPCs #
+#####################
+async def get_transaction_by_hash_async(
+    tx_hash,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    client = None
+) -> dict:
+    """Asynchronous version of get_transaction_by_hash, requires httpx.
+
+    Parameters
+    ----------
+    tx_hash: str
+        Transaction hash to fetch
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    client: :obj:`httpx.AsyncClient`, optional
+        Client to send the request with, see rpc.request_async.make_client
+
+    Returns
+    -------
+    dict, see get_transaction_by_hash for description
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+
+    API Reference
+    -------------
+    https://api.woopchain.com/#117e84f6-a0ec-444e-abe0-455701310389
+    """
+    return await _rpc_result_async(
+        _GET_TRANSACTION_BY_HASH,
+        [ tx_hash ],
+        endpoint,
+        timeout,
+        client,
+    )
+
+
+async def get_transaction_receipt_async(
+    tx_hash,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    client = None
+) -> dict:
+    """Asynchronous version of get_transaction_receipt, requires httpx.
+
+    Parameters
+    ----------
+    tx_hash: str
+        Transaction receipt to fetch
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    client: :obj:`httpx.AsyncClient`, optional
+        Client to send the request with, see rpc.request_async.make_client
+
+    Returns
+    -------
+    dict, see get_transaction_receipt for description
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+
+    API Reference
+    -------------
+    https://api.woopchain.com/#0c2799f8-bcdc-41a4-b362-c3a6a763bb5e
+    """
+    return await _rpc_result_async(
+        _GET_TRANSACTION_RECEIPT,
+        [ tx_hash ],
+        endpoint,
+        timeout,
+        client,
+    )
+
+
+async def get_staking_transaction_by_hash_async(
+    tx_hash,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    client = None
+) -> dict:
+    """Asynchronous version of get_staking_transaction_by_hash, requires
+    httpx.
+
+    Parameters
+    ----------
+    tx_hash: str
+        Hash of staking transaction to fetch
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    client: :obj:`httpx.AsyncClient`, optional
+        Client to send the request with, see rpc.request_async.make_client
+
+    Returns
+    -------
+    dict, see get_staking_transaction_by_hash for description
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+
+    API Reference
+    -------------
+    https://api.woopchain.com/#296cb4d0-bce2-48e3-bab9-64c3734edd27
+    """
+    return await _rpc_result_async(
+        _GET_STAKING_TRANSACTION_BY_HASH,
+        [ tx_hash ],
+        endpoint,
+        timeout,
+        client,
+    )
+
+
+async def send_raw_transaction_async(
+    signed_tx,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    client = None
+) -> str:
+    """Asynchronous version of send_raw_transaction, requires httpx.
+
+    Parameters
+    ----------
+    signed_tx: str
+        Hex representation of signed transaction
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    client: :obj:`httpx.AsyncClient`, optional
+        Client to send the request with, see rpc.request_async.make_client
+
+    Returns
+    -------
+    str
+        Transaction hash
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint, or
+    RPCError
+        If transaction failed to be added to the pool
+
+    API Reference
+    -------------
+    https://api.woopchain.com/#f40d124a-b897-4b7c-baf3-e0dedf8f40a0
+    """
+    return await _rpc_result_async(
+        _SEND_RAW_TRANSACTION,
+        [ signed_tx ],
+        endpoint,
+        timeout,
+        client,
+    )
+
+
+async def send_raw_staking_transaction_async(
+    raw_tx,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    client = None
+) -> str:
+    """Asynchronous version of send_raw_staking_transaction, requires httpx.
+
+    Parameters
+    ----------
+    raw_tx: str
+        Hex representation of signed transaction
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    client: :obj:`httpx.AsyncClient`, optional
+        Client to send the request with, see rpc.request_async.make_client
+
+    Returns
+    -------
+    str
+        Transaction hash
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint, or
+    RPCError
+        If transaction failed to be added to the pool
+
+    API Reference
+    -------------
+    https://api.woopchain.com/#e8c17fe9-e730-4c38-95b3-6f1a5b1b9401
+    """
+    return await _rpc_result_async(
+        _SEND_RAW_STAKING_TRANSACTION,
+        [ raw_tx ],
+        endpoint,
+        timeout,
+        client,
+    )
+
+
+async def send_and_confirm_raw_transaction_async(
+    signed_tx,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    client = None
+) -> dict:
+    """Asynchronous version of send_and_confirm_raw_transaction, requires
+    httpx.
+
+    Parameters
+    ----------
+    signed_tx: str
+        Hex representation of signed transaction
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    client: :obj:`httpx.AsyncClient`, optional
+        Client to send the requests with, see rpc.request_async.make_client
+
+    Returns
+    -------
+    dict
+        Transaction, see get_transaction_by_hash for structure
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint, or
+    RPCError
+        If transaction failed to be added to the pool
+    TxConfirmationTimedoutError
+        If transaction could not be confirmed within the timeout period
+
+    API Reference
+    -------------
+    https://api.woopchain.com/#f40d124a-b897-4b7c-baf3-e0dedf8f40a0
+    """
+    if client is None:
+        async with make_client( endpoint ) as temp_client:
+            return await send_and_confirm_raw_transaction_async(
+                signed_tx,
+                endpoint = endpoint,
+                timeout = timeout,
+                client = temp_client
+            )
+    tx_hash = await send_raw_transaction_async(
+        signed_tx,
+        endpoint = endpoint,
+        client = client
+    )
+    await _poll_until_async(
+        lambda: get_transaction_receipt_async( tx_hash,
+                                               endpoint = endpoint,
+                                               client = client ),
+        lambda receipt: receipt is not None,
+        timeout,
+    )
+    return await get_transaction_by_hash_async(
+        tx_hash,
+        endpoint = endpoint,
+        client = client
+    )
+
+
+async def send_and_confirm_raw_staking_transaction_async(
+    signed_tx,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    client = None
+) -> dict:
+    """Asynchronous version of send_and_confirm_raw_staking_transaction,
+    requires httpx.
+
+    Parameters
+    ----------
+    signed_tx: str
+        Hex representation of signed staking transaction
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    client: :obj:`httpx.AsyncClient`, optional
+        Client to send the requests with, see rpc.request_async.make_client
+
+    Returns
+    -------
+    dict
+        Staking transaction, see get_staking_transaction_by_hash for structure
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint, or
+    RPCError
+        If transaction failed to be added to the pool
+    TxConfirmationTimedoutError
+        If transaction could not be confirmed within the timeout period
+
+    API Reference
+    -------------
+    https://api.woopchain.com/#e8c17fe9-e730-4c38-95b3-6f1a5b1b9401
+    """
+    if client is None:
+        async with make_client( endpoint ) as temp_client:
+            return await send_and_confirm_raw_staking_transaction_async(
+                signed_tx,
+                endpoint = endpoint,
+                timeout = timeout,
+                client = temp_client
+            )
+    tx_hash = await send_raw_staking_transaction_async(
+        signed_tx,
+        endpoint = endpoint,
+        client = client
+    )
+    return await _poll_until_async(
+        lambda: get_staking_transaction_by_hash_async(
             tx_hash,
-            endpoint = endpoint
-        )
-        if tx_response is not None:
-            block_hash = tx_response.get( "blockHash", "0x00" )
-            unique_chars = "".join( set( list( block_hash[ 2 : ] ) ) )
-            if unique_chars != "0":
-                return tx_response
-        time.sleep( random.uniform( 0.2, 0.5 ) )
-    raise TxConfirmationTimedoutError(
-        "Could not confirm transaction on-chain."
+            endpoint = endpoint,
+            client = client
+        ),
+        _is_finalized,
+        timeout,
     )
+
+
+async def send_many_and_confirm(
+    signed_txs,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT
+) -> list:
+    """Send several signed transactions and wait for all of them to be
+    confirmed, concurrently over one connection pool. Requires httpx.
+
+    Parameters
+    ----------
+    signed_txs: :obj:`list` of :obj:`str`
+        Hex representations of signed transactions
+    endpoint: :obj:`str`, optional
+        Endpoint to send requests to
+    timeout: :obj:`int`, optional
+        Timeout in seconds, for each transaction
+
+    Returns
+    -------
+    list of transactions in the same order as signed_txs, see
+    get_transaction_by_hash for structure
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint, or
+    RPCError
+        If a transaction failed to be added to the pool
+    TxConfirmationTimedoutError
+        If a transaction could not be confirmed within the timeout period
+
+    The first error is raised as soon as it occurs, after cancelling the
+    sends and confirmations still in progress; transactions already sent
+    may still land on chain.
+    """
+    import asyncio  # pylint: disable=import-outside-toplevel
+    async with make_client( endpoint ) as client:
+        tasks = [
+            asyncio.ensure_future(
+                send_and_confirm_raw_transaction_async(
+                    signed_tx,
+                    endpoint = endpoint,
+                    timeout = timeout,
+                    client = client
+                )
+            ) for signed_tx in signed_txs
+        ]
+        try:
+            return await asyncio.gather( *tasks )
+        except BaseException:
+            # do not leave the other tasks polling with a closed client
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather( *tasks, return_exceptions = True )
+            raise
@@ -0,0 +1,143 @@
+import time
+
+import pytest
+
+from pywiki import transaction
+from pywiki.constants import DEFAULT_ENDPOINT
+from pywiki.rpc import cache, request
+
+
+def test_get_set():
+    ttl_cache = cache.TTLCache( maxsize = 4, ttl = 60 )
+    assert ttl_cache.get( "a" ) is None
+    assert ttl_cache.get( "a", 1 ) == 1
+    ttl_cache.set( "a", { "blockHash": "0x1" } )
+    assert ttl_cache.get( "a" ) == { "blockHash": "0x1" }
+    assert len( ttl_cache ) == 1
+    ttl_cache.clear()
+    assert ttl_cache.get( "a" ) is None
+    assert len( ttl_cache ) == 0
+
+
+def test_expiry():
+    ttl_cache = cache.TTLCache( ttl = 0.05 )
+    ttl_cache.set( "a", 1 )
+    ttl_cache.set( "b", 2, ttl = 60 )
+    time.sleep( 0.1 )
+    assert ttl_cache.get( "a" ) is None
+    assert ttl_cache.get( "b" ) == 2
+
+
+def test_lru_eviction():
+    ttl_cache = cache.TTLCache( maxsize = 2 )
+    ttl_cache.set( "a", 1 )
+    ttl_cache.set( "b", 2 )
+    ttl_cache.get( "a" )
+    ttl_cache.set( "c", 3 )
+    assert ttl_cache.get( "a" ) == 1
+    assert ttl_cache.get( "b" ) is None
+    assert ttl_cache.get( "c" ) == 3
+    with pytest.raises( ValueError ):
+        cache.TTLCache( maxsize = 0 )
+
+
+def test_cache_enabled( monkeypatch ):
+    monkeypatch.delenv( cache.CACHE_ENV_VAR, raising = False )
+    assert not cache.cache_enabled()
+    monkeypatch.setenv( cache.CACHE_ENV_VAR, "1" )
+    assert cache.cache_enabled()
+
+
+ZERO_HASH = "0x" + "0" * 64
+
+
+@pytest.fixture
+def fake_rpc( monkeypatch ):
+    """Serve RPC results from replies (method -> result) instead of an
+    endpoint, and record the methods called."""
+    calls = []
+
+    def serve( replies ):
+        def rpc_request( method, params, endpoint, timeout ):
+            calls.append( method )
+            return { "jsonrpc": "2.0", "id": "1", "result": replies[ method ] }
+
+        monkeypatch.setattr( request, "rpc_request", rpc_request )
+        return calls
+
+    cache.response_cache.clear()
+    yield serve
+    cache.response_cache.clear()
+
+
+def _ttl( key ):
+    expiry, _ = cache.response_cache._entries[ key ]
+    return expiry - time.monotonic()
+
+
+def test_rpc_cache_disabled_by_default( monkeypatch, fake_rpc ):
+    monkeypatch.delenv( cache.CACHE_ENV_VAR, raising = False )
+    calls = fake_rpc(
+        {
+            "wikiv2_getTransactionByHash": {
+                "blockHash": "0x1"
+            }
+        }
+    )
+    transaction.get_transaction_by_hash( "0x1" )
+    transaction.get_transaction_by_hash( "0x1" )
+    assert len( calls ) == 2
+    assert len( cache.response_cache ) == 0
+
+
+def test_rpc_cache_pending_not_cached( monkeypatch, fake_rpc ):
+    monkeypatch.setenv( cache.CACHE_ENV_VAR, "1" )
+    calls = fake_rpc(
+        {
+            "wikiv2_getTransactionByHash": {
+                "blockHash": ZERO_HASH
+            },
+            "wikiv2_getTransactionReceipt": None,
+        }
+    )
+    # confirmation polling must keep seeing fresh replies
+    transaction.get_transaction_by_hash( "0x1" )
+    transaction.get_transaction_by_hash( "0x1" )
+    transaction.get_transaction_receipt( "0x1" )
+    transaction.get_transaction_receipt( "0x1" )
+    assert len( calls ) == 4
+    assert len( cache.response_cache ) == 0
+
+
+def test_rpc_cache_finalized( monkeypatch, fake_rpc ):
+    monkeypatch.setenv( cache.CACHE_ENV_VAR, "1" )
+    calls = fake_rpc(
+        {
+            "wikiv2_getTransactionByHash": {
+                "blockHash": "0x1"
+            }
+        }
+    )
+    first = transaction.get_transaction_by_hash( "0x1" )
+    first[ "blockHash" ] = "0x2"
+    second = transaction.get_transaction_by_hash( "0x1" )
+    assert second == { "blockHash": "0x1" }
+    third = transaction.get_transaction_by_hash( "0x1" )
+    assert third == second and third is not second
+    assert calls == [ "wikiv2_getTransactionByHash" ]
+    key = (
+        DEFAULT_ENDPOINT,
+        "wikiv2_getTransactionByHash",
+        ( "0x1", )
+    )
+    assert _ttl( key ) == pytest.approx( 600, abs = 0.5 )
+
+
+def test_rpc_cache_pool( monkeypatch, fake_rpc ):
+    monkeypatch.setenv( cache.CACHE_ENV_VAR, "1" )
+    calls = fake_rpc( { "wikiv2_pendingTransactions": [] } )
+    transaction.get_pending_transactions()
+    transaction.get_pending_transactions()
+    assert calls == [ "wikiv2_pendingTransactions" ]
+    key = ( DEFAULT_ENDPOINT, "wikiv2_pendingTransactions", () )
+    assert _ttl( key ) == pytest.approx( 1, abs = 0.5 )
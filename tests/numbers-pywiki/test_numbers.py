@@ -1,31 +1,33 @@
 from decimal import Decimal
 
-from pywiki import numbers
-
+import pytest
 
-def test_convert_atto_to_woc():
-    a = numbers.convert_atto_to_woc( 1e18 )
-    assert Decimal( 1 ) == a
-
-    b = numbers.convert_atto_to_woc( 1e18 + 0.6 )
-    assert Decimal( 1 ) == b
+from pywiki import numbers
 
-    c = numbers.convert_atto_to_woc( "1" + ( "0" * 18 ) )
-    assert Decimal( 1 ) == c
+ONE = Decimal( 1 )
+E18 = Decimal( 10 )**18
+ONE_FIVE_E18 = Decimal( "1.5" ) * E18
 
-    d = numbers.convert_atto_to_woc( Decimal( 1e18 ) )
-    assert Decimal( 1 ) == d
+ATTO_CASES = [
+    ( 1e18, ONE ),
+    ( 1e18 + 0.6, ONE ),
+    ( "1" + ( "0" * 18 ), ONE ),
+    ( Decimal( 1e18 ), ONE ),
+]
 
+WOC_CASES = [
+    ( 1e-18, ONE ),
+    ( 1.5, ONE_FIVE_E18 ),
+    ( "1", E18 ),
+    ( Decimal( 1 ), E18 ),
+]
 
-def test_convert_woc_to_atto():
-    a = numbers.convert_woc_to_atto( 1e-18 )
-    assert Decimal( 1 ) == a
 
-    b = numbers.convert_woc_to_atto( 1.5 )
-    assert Decimal( 1.5e18 ) == b
+@pytest.mark.parametrize( "atto,expected", ATTO_CASES )
+def test_convert_atto_to_woc( atto, expected ):
+    assert expected == numbers.convert_atto_to_woc( atto )
 
-    c = numbers.convert_woc_to_atto( "1" )
-    assert Decimal( 1e18 ) == c
 
-    d = numbers.convert_woc_to_atto( Decimal( 1 ) )
-    assert Decimal( 1e18 ) == d
+@pytest.mark.parametrize( "woc,expected", WOC_CASES )
+def test_convert_woc_to_atto( woc, expected ):
+    assert expected == numbers.convert_woc_to_atto( woc )
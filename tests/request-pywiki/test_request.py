@@ -118,3 +118,20 @@ def test_rpc_request():
 
     if rpc_response is not None:
         assert rpc_response == resp
+
+
+def test_rpc_batch_request():
+    calls = [
+        ( "wikiv2_getNodeMetadata", [] ),
+        ( "wikiv2_getBalance", None ),
+        ( "wikiv2_blockNumber", [] ),
+    ]
+    try:
+        responses = request.rpc_batch_request( calls, batch_size = 2 )
+    except ( exceptions.RequestsTimeoutError, exceptions.RequestsError ) as err:
+        pytest.skip( "can not connect to local blockchain" )
+    assert isinstance( responses, list )
+    assert len( responses ) == len( calls )
+    assert "result" in responses[ 0 ]
+    assert "error" in responses[ 1 ]
+    assert "result" in responses[ 2 ]
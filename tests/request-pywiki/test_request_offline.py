@@ -0,0 +1,379 @@
+import asyncio
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pywiki import transaction
+from pywiki.exceptions import InvalidRPCReplyError
+from pywiki.rpc import exceptions, request, request_async
+
+
+@pytest.fixture
+def batch_server( monkeypatch ):
+    """Replace request._post with a fake endpoint answering JSON-RPC batches
+    through reply( batch ), and record the batches it received."""
+    batches = []
+
+    def serve( reply ):
+        def fake_post( payload, endpoint, timeout ):
+            batches.append( payload )
+            return json.dumps( reply( payload ) ).encode()
+
+        monkeypatch.setattr( request, "_post", fake_post )
+        return batches
+
+    return serve
+
+
+@pytest.fixture
+def slow_endpoint():
+    """Local endpoint which takes 1 second to reply, and counts the POST
+    requests it received."""
+    posts = []
+
+    class SlowHandler( BaseHTTPRequestHandler ):
+        def do_POST( self ):  # pylint: disable=invalid-name
+            posts.append( self.path )
+            time.sleep( 1 )
+            try:
+                self.send_response( 200 )
+                self.end_headers()
+                self.wfile.write(
+                    b'{"jsonrpc": "2.0", "id": "1", "result": 0}'
+                )
+            except ( BrokenPipeError, ConnectionResetError ):
+                pass  # the client gave up, as expected
+
+        def log_message( self, *args ):  # pylint: disable=arguments-differ
+            pass
+
+    server = ThreadingHTTPServer( ( "localhost", 0 ), SlowHandler )
+    server.daemon_threads = True
+    thread = threading.Thread( target = server.serve_forever, daemon = True )
+    thread.start()
+    yield f"http://localhost:{server.server_address[ 1 ]}", posts
+    server.shutdown()
+    server.server_close()
+
+
+def test_rpc_request_read_timeout_not_retried( slow_endpoint ):
+    endpoint, posts = slow_endpoint
+    start = time.monotonic()
+    with pytest.raises( exceptions.RequestsTimeoutError ):
+        request.rpc_request(
+            "wikiv2_sendRawTransaction",
+            [ "0x00" ],
+            endpoint = endpoint,
+            timeout = 0.2
+        )
+    assert time.monotonic() - start < 0.9
+    assert len( posts ) == 1
+
+
+def test_http2_enabled( monkeypatch ):
+    monkeypatch.delenv( request.HTTP2_ENV_VAR, raising = False )
+    assert not request.http2_enabled()
+    monkeypatch.setenv( request.HTTP2_ENV_VAR, "1" )
+    assert request.http2_enabled()
+
+
+def test_http2_rpc_request_errors( monkeypatch, slow_endpoint ):
+    pytest.importorskip( "h2" )
+    monkeypatch.setenv( request.HTTP2_ENV_VAR, "1" )
+    endpoint, posts = slow_endpoint
+    start = time.monotonic()
+    with pytest.raises( exceptions.RequestsTimeoutError ):
+        request.rpc_request(
+            "wikiv2_sendRawTransaction",
+            [ "0x00" ],
+            endpoint = endpoint,
+            timeout = 0.2
+        )
+    assert time.monotonic() - start < 0.9
+    assert len( posts ) == 1
+    # sent by the shared httpx client, not the requests session
+    assert None in request._HTTPX_CLIENTS
+
+    unused = socket.socket()
+    unused.bind( ( "localhost", 0 ) )
+    port = unused.getsockname()[ 1 ]
+    unused.close()
+    with pytest.raises( exceptions.RequestsError ):
+        request.rpc_request(
+            "wikiv2_blockNumber",
+            endpoint = f"http://localhost:{port}",
+            timeout = 0.2
+        )
+
+
+@pytest.fixture
+def unix_endpoint():
+    """JSON-RPC endpoint on a unix socket, whose calls return their params;
+    yields the unix:// endpoint."""
+    pytest.importorskip( "httpx" )
+
+    class EchoHandler( BaseHTTPRequestHandler ):
+        def do_POST( self ):  # pylint: disable=invalid-name
+            payload = json.loads(
+                self.rfile.read( int( self.headers[ "Content-Length" ] ) )
+            )
+            if isinstance( payload, list ):
+                reply = _echo( payload )
+            else:
+                reply = _echo( [ payload ] )[ 0 ]
+            body = json.dumps( reply ).encode()
+            self.send_response( 200 )
+            self.send_header( "Content-Type", "application/json" )
+            self.send_header( "Content-Length", str( len( body ) ) )
+            self.end_headers()
+            self.wfile.write( body )
+
+        def log_message( self, *args ):  # pylint: disable=arguments-differ
+            pass
+
+    with tempfile.TemporaryDirectory() as socket_dir:
+        socket_path = os.path.join( socket_dir, "node.sock" )
+        server = socketserver.ThreadingUnixStreamServer(
+            socket_path,
+            EchoHandler
+        )
+        server.daemon_threads = True
+        thread = threading.Thread(
+            target = server.serve_forever,
+            daemon = True
+        )
+        thread.start()
+        yield f"{request.UNIX_SOCKET_SCHEME}{socket_path}"
+        server.shutdown()
+        server.server_close()
+
+
+def test_unix_socket_rpc_request( unix_endpoint ):
+    resp = request.rpc_request(
+        "wikiv2_getBalance",
+        [ "0x1" ],
+        endpoint = unix_endpoint
+    )
+    assert resp[ "result" ] == [ "0x1" ]
+
+
+def test_unix_socket_rpc_batch_request( unix_endpoint ):
+    responses = request.rpc_batch_request(
+        [ ( "wikiv2_getBalance", [ i ] ) for i in range( 3 ) ],
+        endpoint = unix_endpoint,
+        batch_size = 2,
+    )
+    assert [ resp[ "result" ] for resp in responses ] == [ [ 0 ], [ 1 ], [ 2 ] ]
+
+
+def test_unix_socket_rpc_request_async( unix_endpoint ):
+    resp = asyncio.run(
+        request_async.rpc_request_async(
+            "wikiv2_getBalance",
+            [ "0x1" ],
+            endpoint = unix_endpoint
+        )
+    )
+    assert resp[ "result" ] == [ "0x1" ]
+
+
+def test_httpx_missing_extras( monkeypatch ):
+    monkeypatch.setitem( sys.modules, "httpx", None )
+    monkeypatch.setattr( request, "_HTTPX_CLIENTS", {} )
+    with pytest.raises( ImportError, match = r"pywiki\[async\]" ):
+        request._get_httpx_client( "/tmp/node.sock" )
+    with pytest.raises( ImportError, match = r"pywiki\[http2\]" ):
+        request._get_httpx_client()
+
+
+def _echo( batch ):
+    return [
+        {
+            "jsonrpc": "2.0",
+            "id": call[ "id" ],
+            "result": call[ "params" ]
+        } for call in batch
+    ]
+
+
+def test_rpc_batch_request_orders_replies_by_id( batch_server ):
+    batch_server( lambda batch: list( reversed( _echo( batch ) ) ) )
+    calls = [ ( "wikiv2_getBalance", [ i ] ) for i in range( 3 ) ]
+    responses = request.rpc_batch_request( calls )
+    assert [ resp[ "result" ] for resp in responses ] == [ [ 0 ], [ 1 ], [ 2 ] ]
+
+
+def test_rpc_batch_request_chunks_by_batch_size( batch_server ):
+    batches = batch_server( _echo )
+    calls = [ ( "wikiv2_getBalance", [ i ] ) for i in range( 5 ) ]
+    responses = request.rpc_batch_request( calls, batch_size = 2 )
+    assert [ len( batch ) for batch in batches ] == [ 2, 2, 1 ]
+    assert [ resp[ "result" ] for resp in responses ] == [
+        [ i ] for i in range( 5 )
+    ]
+    with pytest.raises( ValueError ):
+        request.rpc_batch_request( calls, batch_size = 0 )
+
+
+def test_rpc_batch_request_missing_reply( batch_server ):
+    batch_server( lambda batch: _echo( batch )[ 1 : ] )
+    with pytest.raises( exceptions.RPCError ):
+        request.rpc_batch_request(
+            [ ( "wikiv2_getBalance", [ 0 ] ),
+              ( "wikiv2_blockNumber", [] ) ]
+        )
+
+
+def test_rpc_batch_request_whole_batch_error( batch_server ):
+    batch_server(
+        lambda batch: {
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {
+                "code": -32600,
+                "message": "invalid request"
+            },
+        }
+    )
+    with pytest.raises( exceptions.RPCError ):
+        request.rpc_batch_request( [ ( "wikiv2_blockNumber", [] ) ] )
+
+
+def test_rpc_batch_request_per_call_errors( batch_server ):
+    def reply( batch ):
+        replies = _echo( batch )
+        replies[ 0 ] = {
+            "jsonrpc": "2.0",
+            "id": batch[ 0 ][ "id" ],
+            "error": {
+                "code": -32602,
+                "message": "invalid argument"
+            },
+        }
+        return replies
+
+    batch_server( reply )
+    responses = request.rpc_batch_request(
+        [ ( "wikiv2_getBalance", None ),
+          ( "wikiv2_blockNumber", [] ) ]
+    )
+    assert "error" in responses[ 0 ]
+    assert responses[ 1 ][ "result" ] == []
+
+
+def test_batch_results( batch_server ):
+    batch_server( _echo )
+    assert transaction.get_transactions_by_hashes( [ "0x1", "0x2" ] ) == [
+        [ "0x1" ],
+        [ "0x2" ],
+    ]
+
+
+def test_batch_results_errors( batch_server ):
+    batch_server(
+        lambda batch: [
+            {
+                "jsonrpc": "2.0",
+                "id": call[ "id" ],
+                "error": {
+                    "code": -32000,
+                    "message": "not found"
+                },
+            } for call in batch
+        ]
+    )
+    with pytest.raises( exceptions.RPCError ):
+        transaction.get_transactions_by_hashes( [ "0x1" ] )
+
+    batch_server(
+        lambda batch: [
+            {
+                "jsonrpc": "2.0",
+                "id": call[ "id" ]
+            } for call in batch
+        ]
+    )
+    with pytest.raises( InvalidRPCReplyError ):
+        transaction.get_transactions_by_hashes( [ "0x1" ] )
+
+
+def test_rpc_method_endpoint_and_timeout( monkeypatch ):
+    calls = []
+    monkeypatch.setattr(
+        request,
+        "rpc_result",
+        lambda method, params, endpoint, timeout, cache_ttl: calls.append(
+            ( params, endpoint, timeout )
+        ),
+    )
+    transaction.get_transaction_by_hash( "0x1" )
+    transaction.get_transaction_by_hash( "0x1", "http://node:9500", 5 )
+    transaction.get_transaction_by_hash( tx_hash = "0x1", timeout = 7 )
+    assert calls == [
+        ( [ "0x1" ], "http://localhost:9500", 30 ),
+        ( [ "0x1" ], "http://node:9500", 5 ),
+        ( [ "0x1" ], "http://localhost:9500", 7 ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [ 2**64 + 1,
+      -2**63 - 1,
+      10**20 ]
+)
+def test_loads_keeps_large_integers( value ):
+    reply = request._loads( f'{{"result": {value}}}'.encode() )
+    assert reply[ "result" ] == value
+    assert isinstance( reply[ "result" ], int )
+
+
+def _pool_reply():
+    return {
+        "jsonrpc": "2.0",
+        "id": "1",
+        "result": [
+            {
+                "blockHash": "0x" + "0" * 64,
+                "blockNumber": None,
+                "hash": f"0x{i:064x}",
+                "nonce": i,
+                "value": 5 * 10**18,
+            } for i in range( 500 )
+        ],
+    }
+
+
+def _receipt_reply():
+    return {
+        "jsonrpc": "2.0",
+        "id": "1",
+        "result": {
+            "blockHash": "0x" + "1" * 64,
+            "logsBloom": "0x" + "0" * 512,
+            "logs": [ { "topics": [ "0x" + "0" * 64 ] } ],
+            "status": 1,
+        },
+    }
+
+
+@pytest.mark.parametrize( "reply", [ _pool_reply(), _receipt_reply() ] )
+def test_loads_uses_orjson( monkeypatch, reply ):
+    if request.orjson is None:
+        pytest.skip( "orjson is not installed" )
+
+    def json_loads( raw_resp ):
+        raise AssertionError( "reply was decoded with json" )
+
+    raw_resp = json.dumps( reply ).encode()
+    monkeypatch.setattr( request.json, "loads", json_loads )
+    assert request._loads( raw_resp ) == reply
@@ -1,3 +1,4 @@
+import functools
 import json
 import time
 import random
@@ -5,6 +6,8 @@ import random
 import pytest
 import requests
 
+from eth_account import Account
+
 # private keys
 # 1f84c95ac16e6a50f08d44c7bde7aff8742212fda6e4321fde48bf83bef266dc / woc155jp2y76nazx8uw5sa94fr0m4s5aj8e5xm6fu3 (genesis)
 # 3c86ac59f6b038f584be1c08fced78d7c71bb55d5655f81714f3cddc82144c65 / woc1ru3p8ff0wsyl7ncsx3vwd5szuze64qz60upg37 (transferred 503)
@@ -41,6 +44,13 @@ assert len( txs ) == len( tx_hashes ), "Mismatch in tx and tx_hash count"
 assert len( stxs ) == len( stx_hashes ), "Mismatch in stx and stx_hash count"
 
 
+@pytest.fixture( scope = "session" )
+def signer():
+    """Account.from_key, memoized so that each private key is only derived
+    once per test session."""
+    return functools.lru_cache( maxsize = 4 )( Account.from_key )
+
+
 @pytest.fixture( scope = "session", autouse = True )
 def setup_blockchain():
     # return
@@ -206,8 +216,7 @@ def _wait_for_transaction_confirmed( tx_hash, endpoint, timeout = 30 ):
         tx_data = _check_transaction( tx_hash, endpoint )
         if tx_data is not None:
             block_hash = tx_data[ "result" ].get( "blockHash", "0x00" )
-            unique_chars = "".join( set( list( block_hash[ 2 : ] ) ) )
-            if unique_chars != "0":
+            if int( block_hash, 16 ) != 0:
                 return True
         time.sleep( random.uniform( 0.2, 0.5 ) )
     return False
@@ -268,14 +277,12 @@ def _check_staking_transaction( stx_hash, endpoint = endpoint ):
 
 
 def _wait_for_staking_transaction_confirmed( tx_hash, endpoint, timeout = 30 ):
-    answer = False
     start_time = time.time()
     while ( time.time() - start_time ) <= timeout:
         tx_data = _check_staking_transaction( tx_hash, endpoint )
         if tx_data is not None:
             block_hash = tx_data[ "result" ].get( "blockHash", "0x00" )
-            unique_chars = "".join( set( list( block_hash[ 2 : ] ) ) )
-            if unique_chars != "0":
-                answer = True
+            if int( block_hash, 16 ) != 0:
+                return True
         time.sleep( random.uniform( 0.2, 0.5 ) )
-    return answer
+    return False
@@ -1,4 +1,39 @@
+from types import MappingProxyType
+
+import pytest
+
 from pywiki import signing
+
+EXPECTED_RAW_ETH = bytes.fromhex(
+    "f85d0201649414791697260e4c9a71f18484c9f997b308e5932505801ca0b364f4296bfd3231889d1b9ac94c68abbcb8ee6a6c7a5fa412ac82b5b7b0d5d1a02233864842ab28ee4f99c207940a867b0f8534ca362836190792816b48dde3b1"
+)
+EXPECTED_RAW_WIKI = bytes.fromhex(
+    "f85f02016480019414791697260e4c9a71f18484c9f997b308e59325058026a02a203357ca6d7cdec981ad3d3692ad2c9e24536a9b6e7b486ce2f94f28c7563ea010d38cd0312a153af0aa7d8cd986040c36118bba373cb94e3e86fd4aedce904d"
+)
+EXPECTED_RAW_ETH_COMPAT = bytes.fromhex(
+    "f8728085174876e80082520880019419e7e376e7c213b7e7e7e46cc70a5dd086daff2a880de0b6b3a76400008084c6ac98a3a0322cca082c3ca0a1d9ad5fffb4dc0e09ade49b4b0e3b0c9dfa5f6288bc7363d6a05604874964abaaf364e8b10108e8bfed5561c341aa5e4abb92b2c6f4c009ef4c"
+)
+
+KEY1 = "4edef2c24995d15b0e25cbd152fb0e2c05d3b79b9c2afd134e6f59f91bf99e48"
+KEY2 = "0x1111111111111111111111111111111111111111111111111111111111111111"
+
+_TO = "0x14791697260e4c9a71f18484c9f997b308e59325"
+_ETH_BASE = MappingProxyType(
+    {
+        "gasPrice": 1,
+        "gas": 100,  # signing.py uses Ether, which by default calls it gas
+        "to": _TO,
+        "value": 5,
+    }
+)
+_SHARD_BASE = MappingProxyType(
+    {
+        **_ETH_BASE,
+        "shardID": 0,
+        "toShardID": 1,
+    }
+)
+
 """
 Test signature source (node.js)
 import { Transaction, RLPSign, TxStatus } from '@woop-js/transaction';
@@ -27,25 +62,7 @@ let signed = RLPSign(transaction, privateKey);
 console.log( 'Signed transaction' )
 console.log(signed)
 """
-
-
-def test_eth_transaction():
-    transaction_dict = {
-        "nonce": 2,
-        "gasPrice": 1,
-        "gas": 100,  # signing.py uses Ether, which by default calls it gas
-        "to": "0x14791697260e4c9a71f18484c9f997b308e59325",
-        "value": 5,
-    }
-    signed_tx = signing.sign_transaction(
-        transaction_dict,
-        "4edef2c24995d15b0e25cbd152fb0e2c05d3b79b9c2afd134e6f59f91bf99e48",
-    )
-    assert (
-        signed_tx.rawTransaction.hex() ==
-        "0xf85d0201649414791697260e4c9a71f18484c9f997b308e5932505801ca0b364f4296bfd3231889d1b9ac94c68abbcb8ee6a6c7a5fa412ac82b5b7b0d5d1a02233864842ab28ee4f99c207940a867b0f8534ca362836190792816b48dde3b1"
-    )
-
+ETH_TX = MappingProxyType( { **_ETH_BASE, "nonce": 2 } )
 
 """
 Test signature source (node.js)
@@ -77,30 +94,16 @@ let signed = RLPSign(transaction, privateKey);
 console.log( 'Signed transaction' )
 console.log(signed)
 """
-
-
-def test_wiki_transaction():
-    transaction_dict = {
+WIKI_TX = MappingProxyType(
+    {
+        **_SHARD_BASE,
         "nonce": 2,
-        "gasPrice": 1,
-        "gas": 100,  # signing.py uses Ether, which by default calls it gas
-        "to": "0x14791697260e4c9a71f18484c9f997b308e59325",
-        "value": 5,
-        "shardID": 0,
-        "toShardID": 1,
         "chainId": "WikiMainnet",
     }
-    signed_tx = signing.sign_transaction(
-        transaction_dict,
-        "4edef2c24995d15b0e25cbd152fb0e2c05d3b79b9c2afd134e6f59f91bf99e48",
-    )
-    assert (
-        signed_tx.rawTransaction.hex() ==
-        "0xf85f02016480019414791697260e4c9a71f18484c9f997b308e59325058026a02a203357ca6d7cdec981ad3d3692ad2c9e24536a9b6e7b486ce2f94f28c7563ea010d38cd0312a153af0aa7d8cd986040c36118bba373cb94e3e86fd4aedce904d"
-    )
+)
 
-def test_wiki_eth_compatible_transaction():
-    transaction_dict = {
+WIKI_ETH_COMPAT_TX = MappingProxyType(
+    {
         "chainId": 1666600000,
         "gas": 21000,
         "gasPrice": 100000000000,
@@ -110,11 +113,20 @@ def test_wiki_eth_compatible_transaction():
         "toShardID": 1,
         "value": 1000000000000000000
     }
-    signed_tx = signing.sign_transaction(
-        transaction_dict,
-        "0x1111111111111111111111111111111111111111111111111111111111111111",
-    )
-    assert (
-        signed_tx.rawTransaction.hex() ==
-        "0xf8728085174876e80082520880019419e7e376e7c213b7e7e7e46cc70a5dd086daff2a880de0b6b3a76400008084c6ac98a3a0322cca082c3ca0a1d9ad5fffb4dc0e09ade49b4b0e3b0c9dfa5f6288bc7363d6a05604874964abaaf364e8b10108e8bfed5561c341aa5e4abb92b2c6f4c009ef4c"
-    )
+)
+
+CASES = [
+    ( ETH_TX, KEY1, EXPECTED_RAW_ETH ),
+    ( WIKI_TX, KEY1, EXPECTED_RAW_WIKI ),
+    ( WIKI_ETH_COMPAT_TX, KEY2, EXPECTED_RAW_ETH_COMPAT ),
+]
+
+
+@pytest.mark.parametrize(
+    "tx,key,expected",
+    CASES,
+    ids = [ "eth", "wiki", "wiki_eth_compatible" ]
+)
+def test_sign( tx, key, expected, signer ):
+    signed_tx = signing.sign_transaction( dict( tx ), signer( key ) )
+    assert signed_tx.rawTransaction == expected
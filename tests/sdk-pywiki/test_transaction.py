@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from pywiki import transaction
@@ -49,6 +51,13 @@ def test_get_pending_transactions( setup_blockchain ):
     assert isinstance( pool, list )
 
 
+def test_get_pending_transactions_detailed( setup_blockchain ):
+    pool = _test_transaction_rpc(
+        transaction.get_pending_transactions_detailed
+    )
+    assert isinstance( pool, list )
+
+
 def test_get_transaction_by_hash( setup_blockchain ):
     tx = _test_transaction_rpc(
         transaction.get_transaction_by_hash,
@@ -67,6 +76,31 @@ def test_get_transaction_by_hash( setup_blockchain ):
     tx_index = int( tx[ "transactionIndex" ] )
 
 
+def test_get_transactions_by_hashes( setup_blockchain ):
+    txs = _test_transaction_rpc(
+        transaction.get_transactions_by_hashes,
+        [ tx_hash,
+          tx_hash ],
+        endpoint = endpoint
+    )
+    assert isinstance( txs, list )
+    assert len( txs ) == 2
+    assert txs[ 0 ] == txs[ 1 ]
+    assert txs[ 0 ][ "hash" ] == tx_hash
+
+
+def test_get_transaction_by_hash_async( setup_blockchain ):
+    pytest.importorskip( "httpx" )
+    tx = _test_transaction_rpc(
+        asyncio.run,
+        transaction.get_transaction_by_hash_async( tx_hash,
+                                                   endpoint = endpoint )
+    )
+    assert tx
+    assert isinstance( tx, dict )
+    assert tx[ "hash" ] == tx_hash
+
+
 def test_get_transaction_by_block_hash_and_index( setup_blockchain ):
     if not tx_block_hash:
         pytest.skip( "Failed to get reference block hash" )
@@ -103,6 +137,17 @@ def test_get_transaction_receipt( setup_blockchain ):
     assert isinstance( tx_receipt, dict )
 
 
+def test_get_transaction_receipts( setup_blockchain ):
+    tx_receipts = _test_transaction_rpc(
+        transaction.get_transaction_receipts,
+        [ tx_hash ],
+        endpoint = endpoint
+    )
+    assert isinstance( tx_receipts, list )
+    assert len( tx_receipts ) == 1
+    assert isinstance( tx_receipts[ 0 ], dict )
+
+
 def test_get_transaction_error_sink( setup_blockchain ):
     errors = _test_transaction_rpc( transaction.get_transaction_error_sink )
     assert isinstance( errors, list )
@@ -123,6 +168,13 @@ def test_get_pending_cx_receipts( setup_blockchain ):
     assert isinstance( pending, list )
 
 
+def test_get_pending_cx_receipts_detailed( setup_blockchain ):
+    pending = _test_transaction_rpc(
+        transaction.get_pending_cx_receipts_detailed
+    )
+    assert isinstance( pending, list )
+
+
 def test_get_cx_receipt_by_hash( setup_blockchain ):
     cx = _test_transaction_rpc(
         transaction.get_cx_receipt_by_hash,
@@ -156,6 +208,17 @@ def test_get_staking_transaction_by_hash( setup_blockchain ):
     stx_index = int( staking_tx[ "transactionIndex" ] )
 
 
+def test_get_staking_transactions_by_hashes( setup_blockchain ):
+    staking_txs = _test_transaction_rpc(
+        transaction.get_staking_transactions_by_hashes,
+        [ stx_hash ],
+        endpoint = endpoint
+    )
+    assert isinstance( staking_txs, list )
+    assert len( staking_txs ) == 1
+    assert staking_txs[ 0 ][ "hash" ] == stx_hash
+
+
 def test_get_transaction_by_block_hash_and_index( setup_blockchain ):
     if not stx_block_hash:
         pytest.skip( "Failed to get reference block hash" )
@@ -213,15 +276,27 @@ def test_get_pending_staking_transactions( setup_blockchain ):
     assert isinstance( pending_staking_transactions, list )
 
 
+def test_get_pending_staking_transactions_detailed( setup_blockchain ):
+    pending_staking_transactions = _test_transaction_rpc(
+        transaction.get_pending_staking_transactions_detailed,
+        endpoint = endpoint
+    )
+    assert isinstance( pending_staking_transactions, list )
+
+
 def test_errors():
     with pytest.raises( exceptions.RPCError ):
         transaction.get_pending_transactions( fake_shard )
+    with pytest.raises( exceptions.RPCError ):
+        transaction.get_pending_transactions_detailed( fake_shard )
     with pytest.raises( exceptions.RPCError ):
         transaction.get_transaction_error_sink( fake_shard )
     with pytest.raises( exceptions.RPCError ):
         transaction.get_pool_stats( fake_shard )
     with pytest.raises( exceptions.RPCError ):
         transaction.get_transaction_by_hash( "", endpoint = fake_shard )
+    with pytest.raises( exceptions.RPCError ):
+        transaction.get_transactions_by_hashes( [ "" ], endpoint = fake_shard )
     with pytest.raises( exceptions.RPCError ):
         transaction.get_transaction_by_block_hash_and_index(
             "",
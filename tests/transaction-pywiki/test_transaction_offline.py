@@ -0,0 +1,177 @@
+import asyncio
+import json
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pywiki import transaction
+from pywiki.exceptions import TxConfirmationTimedoutError
+from pywiki.rpc.exceptions import RPCError
+
+
+@pytest.fixture
+def fake_clock( monkeypatch ):
+    """Replace time.sleep with a fake clock which only records the delays,
+    and remove the polling jitter."""
+    now = [ 0.0 ]
+    sleeps = []
+
+    def sleep( delay ):
+        sleeps.append( delay )
+        now[ 0 ] += delay
+
+    monkeypatch.setattr( transaction.time, "sleep", sleep )
+    monkeypatch.setattr( transaction.time, "time", lambda: now[ 0 ] )
+    monkeypatch.setattr( transaction.random, "uniform", lambda a, b: 0 )
+    return sleeps
+
+
+@pytest.fixture
+def fake_chain( monkeypatch ):
+    """Fake transaction RPCs, the receipt showing up after `pending` polls
+    (never if None); returns the list of polled hashes."""
+    polls = []
+
+    def setup( pending ):
+        monkeypatch.setattr(
+            transaction,
+            "send_raw_transaction",
+            lambda signed_tx, endpoint: "0xhash"
+        )
+
+        def get_transaction_receipt( tx_hash, endpoint ):
+            polls.append( tx_hash )
+            if pending is None or len( polls ) <= pending:
+                return None
+            return { "transactionHash": tx_hash, "status": 1 }
+
+        monkeypatch.setattr(
+            transaction,
+            "get_transaction_receipt",
+            get_transaction_receipt
+        )
+        monkeypatch.setattr(
+            transaction,
+            "get_transaction_by_hash",
+            lambda tx_hash, endpoint: { "hash": tx_hash, "blockHash": "0x1" }
+        )
+        return polls
+
+    return setup
+
+
+def test_send_and_confirm_polls_with_backoff( fake_clock, fake_chain ):
+    polls = fake_chain( pending = 2 )
+    tx = transaction.send_and_confirm_raw_transaction( "0xsigned" )
+    assert tx == { "hash": "0xhash", "blockHash": "0x1" }
+    assert polls == [ "0xhash" ] * 3
+    assert fake_clock == pytest.approx( [ 0.2, 0.4 ] )
+
+
+def test_send_and_confirm_timeout( fake_clock, fake_chain ):
+    polls = fake_chain( pending = None )
+    with pytest.raises( TxConfirmationTimedoutError ):
+        transaction.send_and_confirm_raw_transaction( "0xsigned", timeout = 8 )
+    # doubling up to the cap, and the last delay clamped to the time left
+    assert fake_clock == pytest.approx( [ 0.2, 0.4, 0.8, 1.6, 2.0, 2.0, 1.0 ] )
+    assert sum( fake_clock ) == pytest.approx( 8 )
+    assert len( polls ) == len( fake_clock ) + 1
+
+
+@pytest.fixture
+def fake_endpoint():
+    """Local JSON-RPC endpoint for the transaction RPCs: a sent transaction's
+    hash is its raw hex, "0xbad" is rejected, and "0xslow" never gets a
+    receipt. Yields the endpoint and the hashes of the receipt polls."""
+    pytest.importorskip( "httpx" )
+    polls = []
+
+    def result( method, params ):
+        if method == "wikiv2_sendRawTransaction":
+            if params[ 0 ] == "0xbad":
+                raise ValueError( "transaction rejected" )
+            return params[ 0 ]
+        if method == "wikiv2_getTransactionReceipt":
+            polls.append( params[ 0 ] )
+            if params[ 0 ] == "0xslow":
+                return None
+            return { "transactionHash": params[ 0 ], "status": 1 }
+        return { "hash": params[ 0 ], "blockHash": "0x1" }
+
+    class RPCHandler( BaseHTTPRequestHandler ):
+        def do_POST( self ):  # pylint: disable=invalid-name
+            call = json.loads(
+                self.rfile.read( int( self.headers[ "Content-Length" ] ) )
+            )
+            reply = { "jsonrpc": "2.0", "id": call[ "id" ] }
+            try:
+                reply[ "result" ] = result( call[ "method" ], call[ "params" ] )
+            except ValueError as err:
+                reply[ "error" ] = { "code": -32000, "message": str( err ) }
+            body = json.dumps( reply ).encode()
+            self.send_response( 200 )
+            self.send_header( "Content-Type", "application/json" )
+            self.send_header( "Content-Length", str( len( body ) ) )
+            self.end_headers()
+            self.wfile.write( body )
+
+        def log_message( self, *args ):  # pylint: disable=arguments-differ
+            pass
+
+    server = ThreadingHTTPServer( ( "localhost", 0 ), RPCHandler )
+    server.daemon_threads = True
+    thread = threading.Thread( target = server.serve_forever, daemon = True )
+    thread.start()
+    yield f"http://localhost:{server.server_address[ 1 ]}", polls
+    server.shutdown()
+    server.server_close()
+
+
+def test_send_and_confirm_async( fake_endpoint ):
+    endpoint, polls = fake_endpoint
+    tx = asyncio.run(
+        transaction.send_and_confirm_raw_transaction_async(
+            "0x1",
+            endpoint = endpoint
+        )
+    )
+    assert tx == { "hash": "0x1", "blockHash": "0x1" }
+    assert polls == [ "0x1" ]
+
+
+def test_send_many_and_confirm( fake_endpoint ):
+    endpoint, _ = fake_endpoint
+    txs = asyncio.run(
+        transaction.send_many_and_confirm(
+            [ "0x1",
+              "0x2",
+              "0x3" ],
+            endpoint = endpoint
+        )
+    )
+    assert [ tx[ "hash" ] for tx in txs ] == [ "0x1", "0x2", "0x3" ]
+
+
+def test_send_many_and_confirm_cancels_on_error( fake_endpoint ):
+    endpoint, polls = fake_endpoint
+
+    async def run():
+        with pytest.raises( RPCError ):
+            await transaction.send_many_and_confirm(
+                [ "0xslow",
+                  "0xbad" ],
+                endpoint = endpoint,
+                timeout = 5
+            )
+        # the confirmation of 0xslow must not outlive the call
+        polled = len( polls )
+        await asyncio.sleep( 0.5 )
+        assert len( polls ) == polled
+        return [
+            task for task in asyncio.all_tasks()
+            if task is not asyncio.current_task()
+        ]
+
+    assert asyncio.run( run() ) == []